@@ -4,102 +4,256 @@ Font Glyph Copy Script
 Copies designated Unicode ranges of glyphs from one TrueType font file to another.
 """
 
+import re
 import sys
+import inspect
 import argparse
-import copy
 import traceback
+from array import array
 from pathlib import Path
 
 try:
     from fontTools.ttLib import TTFont
-    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib.tables._g_l_y_f import Glyph, GlyphComponent
 except ImportError:
     print("Error: fontTools library is required.")
     print("Install it with: pip install fonttools")
     sys.exit(1)
 
 
-def parse_unicode_range(range_str):
+# Shared glyph assigned for every empty (contourless, non-composite) source
+# glyph. glyf compiles each entry independently, so sharing it is safe.
+EMPTY_GLYPH = Glyph()
+EMPTY_GLYPH.numberOfContours = 0
+
+# Glyph.recalcBounds() accepts boundsDone from fontTools 4.44.0 on
+RECALC_BOUNDS_DONE = 'boundsDone' in inspect.signature(Glyph.recalcBounds).parameters
+
+# Single codepoint or START-END range, each with an optional U+ or 0x prefix,
+# matched against upper-cased input
+UNICODE_RANGE_RE = re.compile(r'^(?:U\+|0X)?([0-9A-F]+)(?:\s*-\s*(?:U\+|0X)?([0-9A-F]+))?$')
+
+
+def parse_unicode_range_bounds(range_str):
     """
-    Parse Unicode range string.
+    Parse Unicode range string into its inclusive bounds.
     Formats supported:
     - Single codepoint: U+4E00 or 0x4E00 or 4E00
     - Range: U+4E00-U+9FFF or 0x4E00-0x9FFF or 4E00-9FFF
+
+    Returns:
+        Tuple of (start, end) codepoints; start == end for a single codepoint
     """
-    range_str = range_str.strip().upper()
-
-    # Handle range
-    if '-' in range_str:
-        start_str, end_str = range_str.split('-', 1)
-        start = parse_single_codepoint(start_str.strip())
-        end = parse_single_codepoint(end_str.strip())
-        return list(range(start, end + 1))
-    else:
-        # Single codepoint
-        return [parse_single_codepoint(range_str)]
+    match = UNICODE_RANGE_RE.match(range_str.strip().upper())
+    if match is None:
+        raise ValueError(f"Invalid Unicode range: {range_str!r}")
+
+    start_str, end_str = match.groups()
+    start = int(start_str, 16)
+    # Single codepoint when there is no end part
+    end = int(end_str, 16) if end_str is not None else start
+    return start, end
+
+
+def expand_codepoint_ranges(bounds):
+    """
+    Expand (start, end) bounds into one flat array of codepoints.
+
+    Every range is appended straight from a range object into a single
+    buffer, so no per-range list or array is materialized.
+
+    Args:
+        bounds: Iterable of inclusive (start, end) codepoint tuples
+
+    Returns:
+        array.array of unsigned codepoints (typecode 'L')
+    """
+    codepoints = array('L')
+    for start, end in bounds:
+        codepoints.extend(range(start, end + 1))
+    return codepoints
 
 
-def parse_single_codepoint(cp_str):
-    """Parse a single codepoint string."""
-    cp_str = cp_str.strip().upper()
+def build_cmap(font):
+    """
+    Merge all cmap subtables of a font into a single codepoint -> glyph name dict.
 
-    # Remove U+ prefix if present
-    if cp_str.startswith('U+'):
-        cp_str = cp_str[2:]
-    # Remove 0x prefix if present
-    elif cp_str.startswith('0X'):
-        cp_str = cp_str[2:]
+    When several subtables map the same codepoint, the first subtable wins,
+    matching the order in which they are stored in the font.
 
-    return int(cp_str, 16)
+    Args:
+        font: TTFont object
 
+    Returns:
+        Dict mapping Unicode codepoints to glyph names
+    """
+    cmap = {}
+    for table in reversed(font['cmap'].tables):
+        if hasattr(table, 'cmap'):
+            cmap.update(table.cmap)
+    return cmap
 
-def get_glyph_name_for_codepoint(font, codepoint):
-    """Get the glyph name for a given Unicode codepoint."""
-    for table in font['cmap'].tables:
-        if codepoint in table.cmap:
-            return table.cmap[codepoint]
-    return None
 
+class GlyphPageCache:
+    """
+    Codepoint -> glyph name lookup split into 256-codepoint pages.
 
-def get_component_glyphs(font, glyph_name):
+    Pages are keyed by the high bits of the codepoint (codepoint >> 8) and
+    materialized from the merged cmap on first access, so iterating a dense
+    range such as CJK Unified Ideographs resolves each codepoint with two
+    list/dict index operations on a page that is already built.
     """
-    Recursively get all component glyph names that a glyph depends on.
+
+    PAGE_SHIFT = 8
+    PAGE_SIZE = 1 << PAGE_SHIFT
+    PAGE_MASK = PAGE_SIZE - 1
+
+    def __init__(self, cmap):
+        """
+        Args:
+            cmap: Merged codepoint -> glyph name dict (see build_cmap())
+        """
+        self.cmap = cmap
+        self.pages = {}
+
+    def _load_page(self, page_index):
+        """Build the page for page_index from the cmap and store it."""
+        base = page_index << self.PAGE_SHIFT
+        get = self.cmap.get
+        page = [get(base + offset) for offset in range(self.PAGE_SIZE)]
+        self.pages[page_index] = page
+        return page
+
+    def lookup(self, codepoint):
+        """Get the glyph name for a given Unicode codepoint, or None if unmapped."""
+        page = self.pages.get(codepoint >> self.PAGE_SHIFT)
+        if page is None:
+            page = self._load_page(codepoint >> self.PAGE_SHIFT)
+        return page[codepoint & self.PAGE_MASK]
+
+
+def get_component_glyphs(font, glyph_name, memo=None):
+    """
+    Get all component glyph names that a glyph depends on, transitively.
+
+    The component graph is walked with an explicit stack rather than by
+    recursion, and the dependencies of every composite visited on the way are
+    recorded in memo so components shared by many glyphs are only walked once.
 
     Args:
         font: TTFont object
         glyph_name: Name of the glyph to analyze
+        memo: Optional dict of glyph name -> frozenset of dependencies. Reuse
+            the same dict across calls for one font only.
 
     Returns:
-        Set of glyph names that this glyph depends on
+        Frozenset of glyph names that this glyph depends on
     """
-    components = set()
+    if memo is None:
+        memo = {}
+
+    if glyph_name in memo:
+        return memo[glyph_name]
 
     if 'glyf' not in font:
-        return components
+        return frozenset()
 
-    try:
-        glyph = font['glyf'][glyph_name]
+    glyf = font['glyf']
+    in_progress = set()
+    stack = [(glyph_name, False)]
+
+    while stack:
+        name, expanded = stack.pop()
+        if name in memo:
+            continue
+
+        try:
+            glyph = glyf[name]
+        except KeyError:
+            memo[name] = frozenset()
+            continue
+
+        if not glyph.isComposite():
+            memo[name] = frozenset()
+            continue
+
+        children = [component.glyphName for component in glyph.components]
 
-        # Check if this is a composite glyph
-        if glyph.isComposite():
-            for component in glyph.components:
-                component_name = component.glyphName
-                components.add(component_name)
-                # Recursively get components of components
-                components.update(get_component_glyphs(font, component_name))
-    except:
-        pass
+        if expanded:
+            # All children have been visited; combine their dependencies
+            dependencies = set(children)
+            for child in children:
+                dependencies.update(memo.get(child, ()))
+            memo[name] = frozenset(dependencies)
+            in_progress.discard(name)
+        else:
+            # Revisit this glyph after its children, skipping cyclic references
+            in_progress.add(name)
+            stack.append((name, True))
+            for child in children:
+                if child not in memo and child not in in_progress:
+                    stack.append((child, False))
 
-    return components
+    return memo[glyph_name]
 
 
-def generate_glyph_name(codepoint, existing_names):
+def clone_glyph(glyph):
+    """
+    Make an independent copy of an expanded glyf Glyph.
+
+    Only the containers that could be mutated later (coordinates, contour end
+    points, flags, components) are duplicated; the instruction program is
+    shared, as it is never modified. This replaces copy.deepcopy(), which
+    walks every attribute of the glyph in Python.
+
+    Args:
+        glyph: Expanded Glyph object, as returned by font['glyf'][name]
+
+    Returns:
+        A new Glyph object with the same outline, components and bounds
+    """
+    new_glyph = Glyph()
+    new_glyph.numberOfContours = glyph.numberOfContours
+
+    for attr in ('xMin', 'yMin', 'xMax', 'yMax'):
+        if hasattr(glyph, attr):
+            setattr(new_glyph, attr, getattr(glyph, attr))
+
+    if glyph.isComposite():
+        new_glyph.components = []
+        for component in glyph.components:
+            new_component = GlyphComponent()
+            new_component.__dict__.update(component.__dict__)
+            if hasattr(component, 'transform'):
+                new_component.transform = [row[:] for row in component.transform]
+            new_glyph.components.append(new_component)
+    elif glyph.numberOfContours > 0:
+        # Duplicate the underlying buffers at C level: GlyphCoordinates.copy()
+        # extends a fresh array from the source array, and slicing copies
+        # the flags bytearray/array and contour end point list wholesale
+        new_glyph.coordinates = glyph.coordinates.copy()
+        new_glyph.endPtsOfContours = glyph.endPtsOfContours[:]
+        new_glyph.flags = glyph.flags[:]
+
+    if hasattr(glyph, 'program'):
+        new_glyph.program = glyph.program
+
+    return new_glyph
+
+
+def generate_glyph_name(codepoint, existing_names, resolved_names=None):
     """
     Generate a glyph name for a codepoint that doesn't conflict with existing names.
 
+    The base name is derived from the codepoint alone, so names generated for
+    different codepoints can never collide with each other; only names that
+    already exist in the destination font need to be avoided.
+
     Args:
         codepoint: Unicode codepoint
-        existing_names: Set of existing glyph names to avoid conflicts
+        existing_names: Set of glyph names already in the destination font
+        resolved_names: Optional dict caching base name -> resolved name for
+            bases that conflicted with an existing name
 
     Returns:
         A unique glyph name
@@ -114,15 +268,230 @@ def generate_glyph_name(codepoint, existing_names):
     if base_name not in existing_names:
         return base_name
 
+    if resolved_names is not None and base_name in resolved_names:
+        return resolved_names[base_name]
+
     # If there's a conflict, add a suffix
     counter = 1
     while f"{base_name}.alt{counter}" in existing_names:
         counter += 1
 
-    return f"{base_name}.alt{counter}"
+    name = f"{base_name}.alt{counter}"
+    if resolved_names is not None:
+        resolved_names[base_name] = name
+    return name
+
+
+class LineBuffer:
+    """
+    Collects per-glyph report lines and writes them to stdout in batches.
+
+    Writing one joined chunk every flush_every lines avoids a print() call per
+    glyph when copying large ranges. When disabled, lines are discarded.
+    """
+
+    def __init__(self, enabled=True, flush_every=1000):
+        self.enabled = enabled
+        self.flush_every = flush_every
+        self.lines = []
+
+    def add(self, line):
+        """Queue a line for output, flushing once the batch is full."""
+        if not self.enabled:
+            return
+        self.lines.append(line)
+        if len(self.lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write all queued lines to stdout."""
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            sys.stdout.flush()
+            self.lines.clear()
+
+
+def copy_glyph_pairs(pairs, dest_names, source_glyf, dest_glyf, source_hmtx, dest_hmtx,
+                     source_vmtx, dest_vmtx, log):
+    """
+    Copy glyph outlines and metrics between already-resolved font tables.
+
+    This is the per-glyph hot loop of copy_glyphs(). It only works on table
+    objects, so no TTFont lookups happen per glyph.
+
+    Args:
+        pairs: List of (source_glyph_name, dest_glyph_name, codepoint) tuples;
+            codepoint is None for component glyphs
+        dest_names: Dict mapping source glyph names to destination glyph names,
+            used to rename component references in composite glyphs
+        source_glyf: Source font 'glyf' table
+        dest_glyf: Destination font 'glyf' table
+        source_hmtx: Source font 'hmtx' table, or None to skip horizontal metrics
+        dest_hmtx: Destination font 'hmtx' table, or None to skip horizontal metrics
+        source_vmtx: Source font 'vmtx' table, or None to skip vertical metrics
+        dest_vmtx: Destination font 'vmtx' table, or None to skip vertical metrics
+        log: LineBuffer receiving per-glyph report lines
+
+    Returns:
+        Tuple of (copied_count, failed_count, cmap_updates) where cmap_updates
+        maps each copied codepoint to its destination glyph name
+    """
+    copied_count = 0
+    failed_count = 0
+    cmap_updates = {}
+    get_dest_name = dest_names.get
+
+    # Work on the metrics dicts directly rather than through table __getitem__/__setitem__
+    source_hmetrics = source_hmtx.metrics if source_hmtx is not None else None
+    dest_hmetrics = dest_hmtx.metrics if dest_hmtx is not None else None
+    source_vmetrics = source_vmtx.metrics if source_vmtx is not None else None
+    dest_vmetrics = dest_vmtx.metrics if dest_vmtx is not None else None
+
+    for source_glyph_name, dest_glyph_name, codepoint in pairs:
+        try:
+            # Get the source glyph
+            source_glyph = source_glyf[source_glyph_name]
+
+            if source_glyph.numberOfContours == 0:
+                # Empty glyphs (spaces, blank components) need no copy at all
+                new_glyph = EMPTY_GLYPH
+            else:
+                # Copy the glyph directly instead of redrawing it through a pen.
+                # Composite glyphs reference their components by name, so point
+                # them at the names the components get in the destination font.
+                new_glyph = clone_glyph(source_glyph)
+                if new_glyph.isComposite():
+                    for component in new_glyph.components:
+                        component.glyphName = get_dest_name(component.glyphName, component.glyphName)
+
+            dest_glyf[dest_glyph_name] = new_glyph
+
+            # Copy metrics from hmtx table
+            if source_hmetrics is not None and source_glyph_name in source_hmetrics:
+                dest_hmetrics[dest_glyph_name] = source_hmetrics[source_glyph_name]
+
+            # Copy vertical metrics if present
+            if source_vmetrics is not None and source_glyph_name in source_vmetrics:
+                dest_vmetrics[dest_glyph_name] = source_vmetrics[source_glyph_name]
+
+            # Record the cmap update if this glyph has a codepoint
+            if codepoint is not None:
+                cmap_updates[codepoint] = dest_glyph_name
+
+                char = chr(codepoint) if codepoint <= 0x10FFFF else '?'
+                log.add(f"  ✓ Copied: U+{codepoint:04X} ({char}) -> {dest_glyph_name}")
+                copied_count += 1
+            else:
+                log.add(f"  ✓ Copied component: {dest_glyph_name}")
+
+        except Exception as e:
+            log.flush()
+            if codepoint is not None:
+                char = chr(codepoint) if codepoint <= 0x10FFFF else '?'
+                print(f"  Error copying U+{codepoint:04X} ({char}): {e}")
+            else:
+                print(f"  Error copying component {source_glyph_name}: {e}")
+            failed_count += 1
+            # Formatting a full traceback is expensive; a systematic failure
+            # across a block would repeat it per glyph, so only show the first
+            if failed_count == 1:
+                traceback.print_exc()
+
+    if failed_count > 1:
+        log.flush()
+        print(f"  ({failed_count - 1} more errors; traceback shown for the first only)")
 
+    return copied_count, failed_count, cmap_updates
 
-def copy_glyphs(source_font_path, dest_font_path, output_path, unicode_ranges, new_family_name=None):
+
+def update_copied_glyph_bounds(font, glyph_names):
+    """
+    Recalculate bounds for the given glyphs and fold them into font-wide values.
+
+    The destination font is saved with recalcBBoxes=False so fontTools does
+    not expand and re-measure every glyph in the font. Instead, only the
+    copied glyphs get fresh bounding boxes here, and the 'head' bounding box,
+    'maxp' maxima and 'hhea'/'vhea' extremes are widened to cover them.
+
+    This is only correct when every copied glyph is new to the font. A
+    replaced glyph also changes the composites built from it, and its old
+    extremes may no longer apply, so copy_glyphs() then has fontTools
+    recalculate everything on save instead.
+
+    Args:
+        font: TTFont object with a 'glyf' table
+        glyph_names: Names of the glyphs that were copied into the font
+    """
+    glyf = font['glyf']
+    head = font['head'] if 'head' in font else None
+    maxp = font['maxp'] if 'maxp' in font else None
+
+    # Metrics header tables paired with their metrics dicts
+    hhea = font['hhea'] if 'hhea' in font and 'hmtx' in font else None
+    hmetrics = font['hmtx'].metrics if hhea is not None else None
+    vhea = font['vhea'] if 'vhea' in font and 'vmtx' in font else None
+    vmetrics = font['vmtx'].metrics if vhea is not None else None
+
+    # Composite bounds depend on their components; boundsDone lets fontTools
+    # resolve those in any order without measuring a glyph twice. Older
+    # fontTools measures composites from their expanded outlines instead.
+    bounds_done = set()
+    for glyph_name in glyph_names:
+        if glyph_name in bounds_done:
+            continue
+        if RECALC_BOUNDS_DONE:
+            glyf[glyph_name].recalcBounds(glyf, boundsDone=bounds_done)
+        else:
+            glyf[glyph_name].recalcBounds(glyf)
+        bounds_done.add(glyph_name)
+
+    for glyph_name in glyph_names:
+        glyph = glyf[glyph_name]
+
+        if hhea is not None and glyph_name in hmetrics:
+            hhea.advanceWidthMax = max(hhea.advanceWidthMax, hmetrics[glyph_name][0])
+        if vhea is not None and glyph_name in vmetrics:
+            vhea.advanceHeightMax = max(vhea.advanceHeightMax, vmetrics[glyph_name][0])
+
+        # Empty glyphs do not contribute to any extents
+        if not glyph.numberOfContours:
+            continue
+
+        if head is not None:
+            head.xMin = min(head.xMin, glyph.xMin)
+            head.yMin = min(head.yMin, glyph.yMin)
+            head.xMax = max(head.xMax, glyph.xMax)
+            head.yMax = max(head.yMax, glyph.yMax)
+
+        if maxp is not None:
+            if glyph.isComposite():
+                points, contours, depth = glyph.getCompositeMaxpValues(glyf)
+                maxp.maxCompositePoints = max(maxp.maxCompositePoints, points)
+                maxp.maxCompositeContours = max(maxp.maxCompositeContours, contours)
+                maxp.maxComponentElements = max(maxp.maxComponentElements, len(glyph.components))
+                maxp.maxComponentDepth = max(maxp.maxComponentDepth, depth)
+            else:
+                points, contours = glyph.getMaxpValues()
+                maxp.maxPoints = max(maxp.maxPoints, points)
+                maxp.maxContours = max(maxp.maxContours, contours)
+
+        if hhea is not None and glyph_name in hmetrics:
+            advance, lsb = hmetrics[glyph_name]
+            width = glyph.xMax - glyph.xMin
+            hhea.minLeftSideBearing = min(hhea.minLeftSideBearing, lsb)
+            hhea.minRightSideBearing = min(hhea.minRightSideBearing, advance - lsb - width)
+            hhea.xMaxExtent = max(hhea.xMaxExtent, lsb + width)
+
+        if vhea is not None and glyph_name in vmetrics:
+            advance, tsb = vmetrics[glyph_name]
+            height = glyph.yMax - glyph.yMin
+            vhea.minTopSideBearing = min(vhea.minTopSideBearing, tsb)
+            vhea.minBottomSideBearing = min(vhea.minBottomSideBearing, advance - tsb - height)
+            vhea.yMaxExtent = max(vhea.yMaxExtent, tsb + height)
+
+
+def copy_glyphs(source_font_path, dest_font_path, output_path, unicode_ranges, new_family_name=None,
+                quiet=False):
     """
     Copy glyphs from source font to destination font for specified Unicode ranges.
 
@@ -132,23 +501,36 @@ def copy_glyphs(source_font_path, dest_font_path, output_path, unicode_ranges, n
         output_path: Path to save the modified font
         unicode_ranges: List of Unicode codepoint ranges to copy
         new_family_name: Optional new font family name for the output font
+        quiet: If True, suppress per-glyph output and only print totals
     """
+    # Fonts are opened lazily so tables (and glyphs) are only read and
+    # decompiled when they are actually accessed. The source font is never
+    # saved, so its bounding boxes never need recalculating.
     print(f"Loading source font: {source_font_path}")
-    source_font = TTFont(source_font_path)
+    source_font = TTFont(source_font_path, lazy=True, recalcBBoxes=False)
+
+    # A lazily loaded font keeps reading from its file and fontTools refuses to
+    # save it over that file, so use default loading when overwriting in place
+    dest_lazy = Path(dest_font_path).resolve() != Path(output_path).resolve()
 
     print(f"Loading destination font: {dest_font_path}")
-    dest_font = TTFont(dest_font_path)
+    # Bounding boxes are only recalculated for the copied glyphs (see
+    # update_copied_glyph_bounds()), not for every glyph at save time,
+    # unless the copy replaces existing destination glyphs
+    dest_font = TTFont(dest_font_path, lazy=dest_lazy or None, recalcBBoxes=False)
 
-    # Collect all codepoints to copy
-    codepoints_to_copy = []
-    for range_str in unicode_ranges:
-        codepoints = parse_unicode_range(range_str)
-        codepoints_to_copy.extend(codepoints)
+    # Collect all codepoints to copy into a flat unsigned array instead of a list of ints
+    codepoints_to_copy = expand_codepoint_ranges(
+        parse_unicode_range_bounds(range_str) for range_str in unicode_ranges)
 
     print(f"Processing {len(codepoints_to_copy)} codepoints...")
 
+    # Merge the source cmap subtables once and serve lookups from glyph pages
+    source_pages = GlyphPageCache(build_cmap(source_font))
+
     copied_count = 0
     skipped_count = 0
+    log = LineBuffer(enabled=not quiet)
 
     # Get glyph set from both fonts
     source_glyf = source_font['glyf']
@@ -160,98 +542,79 @@ def copy_glyphs(source_font_path, dest_font_path, output_path, unicode_ranges, n
 
     # Get existing glyph names in destination to avoid conflicts
     existing_glyph_names = set(dest_glyf.keys())
+    resolved_glyph_names = {}
+    component_memo = {}
 
-    # First pass: collect main glyphs and their codepoints
-    for codepoint in codepoints_to_copy:
-        # Get glyph name from source font
-        source_glyph_name = get_glyph_name_for_codepoint(source_font, codepoint)
+    # Look up all source glyph names in one bulk pass
+    source_glyph_names = list(map(source_pages.lookup, codepoints_to_copy))
 
+    missing_codepoints = [cp for cp, name in zip(codepoints_to_copy, source_glyph_names) if name is None]
+    for codepoint in missing_codepoints:
+        char = chr(codepoint) if codepoint <= 0x10FFFF else '?'
+        log.add(f"  Skip: U+{codepoint:04X} ({char}) - not in source font")
+    skipped_count += len(missing_codepoints)
+
+    # First pass: collect main glyphs and their codepoints
+    for codepoint, source_glyph_name in zip(codepoints_to_copy, source_glyph_names):
         if source_glyph_name is None:
-            char = chr(codepoint) if codepoint <= 0x10FFFF else '?'
-            print(f"  Skip: U+{codepoint:04X} ({char}) - not in source font")
-            skipped_count += 1
             continue
 
         # Generate appropriate glyph name that matches the codepoint
         # Always generate a new name to ensure consistency between name and codepoint
-        dest_glyph_name = generate_glyph_name(codepoint, existing_glyph_names)
-        existing_glyph_names.add(dest_glyph_name)
+        dest_glyph_name = generate_glyph_name(codepoint, existing_glyph_names, resolved_glyph_names)
 
         glyphs_to_copy[source_glyph_name] = (codepoint, dest_glyph_name)
 
         # Get all component glyphs this glyph depends on
-        components = get_component_glyphs(source_font, source_glyph_name)
+        components = get_component_glyphs(source_font, source_glyph_name, component_memo)
         component_glyphs.update(components)
 
-    # Add component glyphs to the copy list
-    for component_name in component_glyphs:
-        if component_name not in glyphs_to_copy and component_name in source_glyf:
-            # Component glyphs keep their original names and don't have direct codepoint mappings
-            glyphs_to_copy[component_name] = (None, component_name)
+    # Add component glyphs to the copy list: those not already being copied
+    # that exist in the source font, computed with set operations on key views
+    pending_components = (component_glyphs - glyphs_to_copy.keys()) & source_glyf.keys()
+    for component_name in sorted(pending_components):
+        # Component glyphs keep their original names and don't have direct codepoint mappings
+        glyphs_to_copy[component_name] = (None, component_name)
 
+    log.flush()
     print(f"Total glyphs to copy (including components): {len(glyphs_to_copy)}")
 
-    # Second pass: copy all glyphs
-    for source_glyph_name, (codepoint, dest_glyph_name) in glyphs_to_copy.items():
-        try:
-            # Get the source glyph
-            source_glyph = source_glyf[source_glyph_name]
-
-            # Use TTGlyphPen to properly copy the glyph
-            # This handles both simple and composite glyphs correctly
-            pen = TTGlyphPen(dest_font.getGlyphSet())
-
-            # Draw the source glyph using the pen
-            source_glyph_set = source_font.getGlyphSet()
-            if source_glyph_name in source_glyph_set:
-                try:
-                    source_glyph_set[source_glyph_name].draw(pen)
-                    new_glyph = pen.glyph()
-
-                    # Preserve glyph properties
-                    if hasattr(source_glyph, 'program'):
-                        new_glyph.program = source_glyph.program
-
-                    dest_glyf[dest_glyph_name] = new_glyph
-                except:
-                    # Fallback: direct copy for glyphs that can't be drawn
-                    dest_glyf[dest_glyph_name] = copy.deepcopy(source_glyph)
-            else:
-                # Direct copy for glyphs not in glyph set
-                dest_glyf[dest_glyph_name] = copy.deepcopy(source_glyph)
+    # Map source glyph names to the names they are copied to
+    dest_names = {name: dest_name for name, (_, dest_name) in glyphs_to_copy.items()}
 
-            # Copy metrics from hmtx table
-            if 'hmtx' in source_font and 'hmtx' in dest_font:
-                if source_glyph_name in source_font['hmtx'].metrics:
-                    source_metrics = source_font['hmtx'][source_glyph_name]
-                    dest_font['hmtx'][dest_glyph_name] = source_metrics
-
-            # Copy vertical metrics if present
-            if 'vmtx' in source_font and 'vmtx' in dest_font:
-                if source_glyph_name in source_font['vmtx'].metrics:
-                    source_vmetrics = source_font['vmtx'][source_glyph_name]
-                    dest_font['vmtx'][dest_glyph_name] = source_vmetrics
-
-            # Update cmap if this glyph has a codepoint
-            if codepoint is not None:
-                for table in dest_font['cmap'].tables:
-                    if hasattr(table, 'cmap'):
-                        table.cmap[codepoint] = dest_glyph_name
-
-                char = chr(codepoint) if codepoint <= 0x10FFFF else '?'
-                print(f"  ✓ Copied: U+{codepoint:04X} ({char}) -> {dest_glyph_name}")
-                copied_count += 1
-            else:
-                print(f"  ✓ Copied component: {dest_glyph_name}")
+    # Metrics are only copied for tables present in both fonts
+    has_hmtx = 'hmtx' in source_font and 'hmtx' in dest_font
+    has_vmtx = 'vmtx' in source_font and 'vmtx' in dest_font
 
-        except Exception as e:
-            if codepoint is not None:
-                char = chr(codepoint) if codepoint <= 0x10FFFF else '?'
-                print(f"  Error copying U+{codepoint:04X} ({char}): {e}")
-            else:
-                print(f"  Error copying component {source_glyph_name}: {e}")
-            skipped_count += 1
-            traceback.print_exc()
+    # Second pass: copy all glyphs
+    copy_pairs = [(name, dest_name, codepoint) for name, (codepoint, dest_name) in glyphs_to_copy.items()]
+
+    # Component glyphs keep their source names, so they can replace destination
+    # glyphs that untouched destination composites are built from
+    replaces_dest_glyphs = not existing_glyph_names.isdisjoint(dest_names.values())
+    copied, failed, cmap_updates = copy_glyph_pairs(
+        copy_pairs, dest_names, source_glyf, dest_glyf,
+        source_font['hmtx'] if has_hmtx else None, dest_font['hmtx'] if has_hmtx else None,
+        source_font['vmtx'] if has_vmtx else None, dest_font['vmtx'] if has_vmtx else None,
+        log)
+    copied_count += copied
+    skipped_count += failed
+
+    log.flush()
+
+    # Apply all cmap updates in one pass over the subtables
+    for table in dest_font['cmap'].tables:
+        if hasattr(table, 'cmap'):
+            table.cmap.update(cmap_updates)
+
+    if replaces_dest_glyphs:
+        # Composites using a replaced glyph change shape as well, so let
+        # fontTools recalculate every glyph and the font-wide values on save
+        dest_font.recalcBBoxes = True
+    else:
+        # Recalculate bounds of the copied glyphs only
+        update_copied_glyph_bounds(
+            dest_font, [dest_name for _, dest_name, _ in copy_pairs if dest_name in dest_glyf])
 
     # Rename font family if requested
     if new_family_name:
@@ -272,8 +635,11 @@ def copy_glyphs(source_font_path, dest_font_path, output_path, unicode_ranges, n
         print("      Output font will be a static font (non-variable)")
 
     # Save the modified font
+    # Tables that were never accessed are written back from their original
+    # compiled bytes. reorderTables=None keeps fontTools' dependency-ordered
+    # layout instead of re-streaming every table through a second writer.
     print(f"\nSaving modified font to: {output_path}")
-    dest_font.save(output_path)
+    dest_font.save(output_path, reorderTables=None)
 
     print(f"\n✓ Complete!")
     print(f"  Copied: {copied_count} glyphs")
@@ -297,40 +663,40 @@ def rename_font_family(font, new_family_name):
 
     name_table = font['name']
 
-    # Get the current subfamily (e.g., "Regular", "Bold") from nameID 2
-    subfamily = None
+    # Group name records by nameID in a single pass
+    records_by_id = {}
     for record in name_table.names:
-        if record.nameID == 2:
-            subfamily = record.toUnicode()
-            break
+        records_by_id.setdefault(record.nameID, []).append(record)
 
-    if subfamily is None:
+    # Get the current subfamily (e.g., "Regular", "Bold") from nameID 2
+    subfamily_records = records_by_id.get(2)
+    if subfamily_records:
+        subfamily = subfamily_records[0].toUnicode()
+    else:
         subfamily = "Regular"
 
-    # Update name records
-    for record in name_table.names:
-        # nameID 1: Font Family name
-        if record.nameID == 1:
-            record.string = new_family_name
-
-        # nameID 4: Full font name (Family + Subfamily)
-        elif record.nameID == 4:
-            full_name = f"{new_family_name} {subfamily}"
-            record.string = full_name
+    # nameID 4: Full font name (Family + Subfamily)
+    full_name = f"{new_family_name} {subfamily}"
+    # nameID 6: PostScript name (no spaces)
+    postscript_name = f"{new_family_name.replace(' ', '')}-{subfamily.replace(' ', '')}"
 
-        # nameID 6: PostScript name (no spaces)
-        elif record.nameID == 6:
-            postscript_name = f"{new_family_name.replace(' ', '')}-{subfamily.replace(' ', '')}"
-            record.string = postscript_name
+    # nameID 1: Font Family name, nameID 16: Typographic Family name (if present)
+    new_strings = {
+        1: new_family_name,
+        4: full_name,
+        6: postscript_name,
+        16: new_family_name,
+    }
 
-        # nameID 16: Typographic Family name (if present)
-        elif record.nameID == 16:
-            record.string = new_family_name
+    # Update name records
+    for name_id, string in new_strings.items():
+        for record in records_by_id.get(name_id, ()):
+            record.string = string
 
     print(f"Font family renamed to: {new_family_name}")
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='Copy glyphs from one TrueType font to another for specified Unicode ranges.',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -350,6 +716,9 @@ Examples:
 
   # Copy glyphs and rename font family
   %(prog)s source.ttf dest.ttf output.ttf -r U+4E00-U+9FFF -f "My Custom Font"
+
+  # Copy a large range without per-glyph output
+  %(prog)s source.ttf dest.ttf output.ttf -r U+4E00-U+9FFF -q
         """
     )
 
@@ -360,8 +729,10 @@ Examples:
                         help='Unicode range to copy (e.g., U+4E00-U+9FFF). Can be specified multiple times.')
     parser.add_argument('-f', '--family-name', type=str, dest='family_name',
                         help='New font family name for the output font (optional)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Suppress per-glyph output and only print totals')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate input files exist
     source_path = Path(args.source)
@@ -379,13 +750,16 @@ Examples:
 
     # Perform the copy operation
     try:
-        copy_glyphs(str(source_path), str(dest_path), str(output_path), args.ranges, args.family_name)
+        copy_glyphs(str(source_path), str(dest_path), str(output_path), args.ranges, args.family_name,
+                    quiet=args.quiet)
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
+    return 0
+
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
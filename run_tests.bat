@@ -29,8 +29,19 @@ echo.
 echo Running integration tests...
 echo.
 
-REM Run the tests
-python test_integration.py
+REM Run the tests, in parallel when pytest-xdist is available
+REM Leave two cores free for the rest of the system, but use at least one worker
+set /a WORKERS=%NUMBER_OF_PROCESSORS%-2
+if %WORKERS% LSS 1 set WORKERS=1
+
+python -c "import xdist" 2>nul
+if errorlevel 1 (
+    python test_integration.py
+) else (
+    REM Run the smoke test first and stop early if the script is broken
+    python -m pytest -x test_integration.py::SmokeTest
+    if not errorlevel 1 python -m pytest -n %WORKERS% --dist=loadscope --deselect test_integration.py::SmokeTest test_integration.py
+)
 
 if errorlevel 1 (
     echo.
@@ -28,8 +28,23 @@ echo ""
 echo "Running integration tests..."
 echo ""
 
-# Run the tests
-python3 test_integration.py
+# Run the tests, in parallel when pytest-xdist is available
+if python3 -c "import xdist" 2>/dev/null; then
+    # Leave two cores free for the rest of the system, but use at least one worker
+    workers=$(( $(getconf _NPROCESSORS_ONLN) - 2 ))
+    if [ "$workers" -lt 1 ]; then
+        workers=1
+    fi
+    # Run the smoke test first and stop early if the script is broken
+    if ! python3 -m pytest -x test_integration.py::SmokeTest; then
+        echo ""
+        echo "✗ Smoke test failed"
+        exit 1
+    fi
+    python3 -m pytest -n "$workers" --dist=loadscope --deselect test_integration.py::SmokeTest test_integration.py
+else
+    python3 test_integration.py
+fi
 
 exit_code=$?
 
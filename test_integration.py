@@ -4,156 +4,328 @@ Integration tests for the font glyph copy script.
 Tests actual font merging operations with real font files.
 """
 
+import functools
+import hashlib
+import io
+import logging
+import mmap
 import os
+import pickle
 import sys
-import subprocess
+import tempfile
 import unittest
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
+from types import SimpleNamespace
 
 try:
+    from fontTools import version as fonttools_version
     from fontTools.ttLib import TTFont
 except ImportError:
     print("Error: fontTools library is required for testing.")
     print("Install it with: pip install fonttools")
     sys.exit(1)
 
-
-class FontMergeIntegrationTest(unittest.TestCase):
-    """Integration tests for copy_font_glyphs.py"""
+sys.path.insert(0, str(Path(__file__).parent))
+import copy_font_glyphs
+
+logger = logging.getLogger(__name__)
+
+
+def _require_exists(path, description):
+    """Return path, raising FileNotFoundError if it does not exist."""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{description} not found: {path}") from None
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _fixtures():
+    """
+    Locate and verify the input files used by the tests.
+
+    The files are checked once per process, on first use, rather than by
+    every test class.
+    """
+    test_dir = Path(__file__).parent
+    return {
+        'script': _require_exists(test_dir / "copy_font_glyphs.py", "Script"),
+        'source': _require_exists(test_dir / "PretendardJPVariable.ttf", "Source font"),
+        'dest': _require_exists(
+            test_dir / "GoogleSansFlex-VariableFont_GRAD,ROND,opsz,slnt,wdth,wght.ttf",
+            "Destination font"),
+    }
+
+
+# Files kept between test runs (ignored by git)
+CACHE_DIR = Path(__file__).parent / ".pytest_cache"
+
+# Signature of the fixtures at the last successful run, see _fixture_sig()
+FIXTURE_SIG_PATH = CACHE_DIR / "font_merge_sig"
+
+# Set by run_tests() when FONT_MERGE_CACHE is set, so only that runner skips
+# on the signature; under pytest the tests always run
+_use_fixture_sig = False
+
+
+def _fixture_sig():
+    """
+    Return a signature of everything that decides what the tests check.
+
+    The script and tests are hashed by content and the fonts by modification
+    time. The fontTools version and FONT_MERGE_SLOW are included too, so a
+    run that enables more tests or uses another fontTools is never skipped.
+    """
+    fixtures = _fixtures()
+    digest = hashlib.blake2b()
+    digest.update(fixtures['script'].read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    for font in (fixtures['source'], fixtures['dest']):
+        digest.update(str(os.stat(font).st_mtime_ns).encode())
+    digest.update(fonttools_version.encode())
+    digest.update(b"slow" if os.environ.get("FONT_MERGE_SLOW") else b"fast")
+    return digest.hexdigest()
+
+
+def _fixtures_unchanged():
+    """Return True if run_tests() uses the signature and the last successful run had the same fixtures."""
+    if not _use_fixture_sig:
+        return False
+    try:
+        return FIXTURE_SIG_PATH.read_text().strip() == _fixture_sig()
+    except OSError:
+        return False
+
+
+def _output_dir(name):
+    """
+    Create a temporary directory for the output fonts of one test or class.
+
+    The directory name includes the pytest-xdist worker id and the test name,
+    so leftovers from an interrupted parallel run can be traced back.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return tempfile.TemporaryDirectory(prefix=f"font_merge_{worker_id}_{name}_")
+
+
+def _open_readonly(path):
+    """
+    Open a font file read-only through a memory map.
+
+    The file is mapped instead of read into memory, and lazy=True makes
+    fontTools read tables straight from the map on first access. The map is
+    owned by the font's reader and is closed by TTFont.close().
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return TTFont(mapped, lazy=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _codepoints_for(path):
+    """
+    Return the codepoints mapped by a font's best Unicode cmap subtable.
+
+    Results are cached per path for the whole process; call
+    _codepoints_for.cache_clear() once a font at a cached path is rewritten.
+    """
+    font = _open_readonly(path)
+    try:
+        return frozenset(font['cmap'].getBestCmap())
+    finally:
+        font.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _composite_codepoints(path, limit=3):
+    """Return up to limit codepoints that a font maps to composite glyphs, lowest first."""
+    font = _open_readonly(path)
+    try:
+        glyf = font['glyf']
+        found = []
+        for codepoint, glyph_name in sorted(font['cmap'].getBestCmap().items()):
+            if glyf[glyph_name].isComposite():
+                found.append(codepoint)
+                if len(found) == limit:
+                    break
+        return found
+    finally:
+        font.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _replacing_codepoints(source_path, dest_path):
+    """
+    Return the source codepoints whose copy replaces a destination glyph.
+
+    Copied components keep their source names, so a composite with a
+    component (at any depth) named like a destination glyph overwrites it.
+    """
+    source = _open_readonly(source_path)
+    dest = _open_readonly(dest_path)
+    try:
+        dest_names = set(dest.getGlyphOrder())
+        source_glyf = source['glyf']
+        memo = {}
+        return frozenset(
+            codepoint for codepoint, glyph_name in source['cmap'].getBestCmap().items()
+            if source_glyf[glyph_name].isComposite()
+            and not dest_names.isdisjoint(copy_font_glyphs.get_component_glyphs(source, glyph_name, memo)))
+    finally:
+        source.close()
+        dest.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_source_meta(path):
+    """
+    Return the codepoints, best cmap and hmtx metrics of a source font.
+
+    The tests only read these from the source font, so they are pickled to
+    .pytest_cache/<font>.cache.pkl and reused while the font's modification time and size
+    are unchanged, instead of parsing the font on every run. Parallel workers
+    share the same cache file, so the font is parsed once for all of them.
+
+    Returns:
+        Tuple of (codepoint frozenset, codepoint -> glyph name dict,
+        glyph name -> (advance width, lsb) dict)
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cache_path = CACHE_DIR / (Path(path).name + ".cache.pkl")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, meta = pickle.load(f)
+        if cached_key == key:
+            return meta
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+
+    font = _open_readonly(path)
+    try:
+        best_cmap = dict(font['cmap'].getBestCmap())
+        meta = (frozenset(best_cmap), best_cmap, dict(font['hmtx'].metrics))
+    finally:
+        font.close()
+
+    # The cache only saves time, so failing to write it (e.g. in a read-only
+    # checkout) is not an error. It is written to a temporary file and renamed
+    # into place, so parallel (pytest-xdist) workers never load a partly
+    # written cache.
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, meta), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write source font cache %s: %s", cache_path, e)
+    return meta
+
+
+class FontMergeTestCase(unittest.TestCase):
+    """Shared fixtures and helpers for the copy_font_glyphs.py integration tests."""
 
     @classmethod
     def setUpClass(cls):
-        """Set up test fixtures that are used across all tests."""
-        cls.script_path = Path(__file__).parent / "copy_font_glyphs.py"
-        cls.source_font = Path(__file__).parent / "PretendardJPVariable.ttf"
-        cls.dest_font = Path(__file__).parent / "GoogleSansFlex-VariableFont_GRAD,ROND,opsz,slnt,wdth,wght.ttf"
-        cls.output_font = Path(__file__).parent / "test_output.ttf"
-        cls.output_renamed = Path(__file__).parent / "test_output_renamed.ttf"
-
-        # Verify required files exist
-        if not cls.script_path.exists():
-            raise FileNotFoundError(f"Script not found: {cls.script_path}")
-        if not cls.source_font.exists():
-            raise FileNotFoundError(f"Source font not found: {cls.source_font}")
-        if not cls.dest_font.exists():
-            raise FileNotFoundError(f"Destination font not found: {cls.dest_font}")
-
-    def setUp(self):
-        """Set up before each test."""
-        # Clean up any existing test output files
-        self._cleanup_output_files()
+        """Locate and verify the input files used by the tests."""
+        fixtures = _fixtures()
+        cls.source_font = fixtures['source']
+        cls.dest_font = fixtures['dest']
 
-    def tearDown(self):
-        """Clean up after each test."""
-        self._cleanup_output_files()
+        if _fixtures_unchanged():
+            raise unittest.SkipTest("fixtures unchanged since the last successful run")
 
-    def _cleanup_output_files(self):
-        """Remove test output files if they exist."""
-        for output_file in [self.output_font, self.output_renamed]:
-            if output_file.exists():
-                output_file.unlink()
-
-    def _run_script(self, *args):
+    @staticmethod
+    def _run_script(*args):
         """
-        Run the copy_font_glyphs.py script with given arguments.
+        Run copy_font_glyphs.main() in-process with given arguments.
 
         Returns:
-            subprocess.CompletedProcess with stdout, stderr, and returncode
+            SimpleNamespace with stdout, stderr, and returncode
         """
-        cmd = [sys.executable, str(self.script_path)] + list(args)
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
-        )
-        return result
-
-    def test_script_help(self):
-        """Test that the script shows help message."""
-        result = self._run_script("--help")
-        self.assertEqual(result.returncode, 0, "Help command should exit with code 0")
-        self.assertIn("Copy glyphs", result.stdout, "Help should mention 'Copy glyphs'")
-        self.assertIn("--range", result.stdout, "Help should document --range option")
-        self.assertIn("--family-name", result.stdout, "Help should document --family-name option")
-
-    def test_copy_cjk_range(self):
-        """Test copying CJK Unified Ideographs range (U+4E00-U+9FFF)."""
-        result = self._run_script(
-            str(self.source_font),
-            str(self.dest_font),
-            str(self.output_font),
-            "-r", "U+4E00-U+9FFF"
-        )
-
-        # Print output for debugging
-        print("\n--- Script Output ---")
-        print(result.stdout)
-        if result.stderr:
-            print("--- Script Errors ---")
-            print(result.stderr)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                returncode = copy_font_glyphs.main(list(args))
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else (e.code is not None)
+        return SimpleNamespace(returncode=int(returncode or 0),
+                               stdout=stdout.getvalue(), stderr=stderr.getvalue())
 
-        # Check script executed successfully
-        self.assertEqual(result.returncode, 0, f"Script should exit with code 0. Error: {result.stderr}")
-
-        # Verify output file was created
-        self.assertTrue(self.output_font.exists(), "Output font file should be created")
-
-        # Load the output font
-        output = TTFont(str(self.output_font))
 
-        # Verify the font can be loaded
-        self.assertIsNotNone(output, "Output font should be loadable")
+class SmokeTest(FontMergeTestCase):
+    """Fast check that the script works at all, run before the other tests."""
 
-        # Check that cmap table exists
-        self.assertIn('cmap', output, "Output font should have cmap table")
+    def test_smoke_fast(self):
+        """Test --help and a single-codepoint copy."""
+        result = self._run_script("--help")
+        self.assertEqual(result.returncode, 0, "Help command should exit with code 0")
 
-        # Get all Unicode codepoints from cmap
-        cmap_codepoints = set()
-        for table in output['cmap'].tables:
-            if hasattr(table, 'cmap'):
-                cmap_codepoints.update(table.cmap.keys())
+        with _output_dir(self._testMethodName) as tmp_dir:
+            output_font = Path(tmp_dir) / "test_output.ttf"
+            result = self._run_script(
+                str(self.source_font),
+                str(self.dest_font),
+                str(output_font),
+                "-r", "U+4E00",
+                "-q"
+            )
 
-        # Test some specific CJK characters that should be present
-        test_codepoints = [
-            0x4E00,  # 一 (one)
-            0x4E8C,  # 二 (two)
-            0x4E09,  # 三 (three)
-            0x6C34,  # 水 (water)
-            0x706B,  # 火 (fire)
-            0x6728,  # 木 (tree/wood)
-            0x91D1,  # 金 (gold/metal)
-            0x571F,  # 土 (earth)
-        ]
+            self.assertEqual(result.returncode, 0, f"Script should exit with code 0. Error: {result.stderr}")
+            self.assertTrue(output_font.exists(), "Output font should be created")
 
-        # Load source font to check which codepoints are available
-        source = TTFont(str(self.source_font))
-        source_codepoints = set()
-        for table in source['cmap'].tables:
-            if hasattr(table, 'cmap'):
-                source_codepoints.update(table.cmap.keys())
+        # -q keeps the summary but drops the per-glyph report lines
+        self.assertRegex(result.stdout, r"Copied: [1-9]\d* glyphs", "Quiet run should still print the summary")
+        self.assertNotIn("✓ Copied", result.stdout, "Quiet run should not report individual glyphs")
 
-        # Check that test codepoints that exist in source are in output
-        copied_count = 0
-        for cp in test_codepoints:
-            if cp in source_codepoints:
-                self.assertIn(cp, cmap_codepoints,
-                    f"Codepoint U+{cp:04X} ({chr(cp)}) should be in output font")
-                copied_count += 1
 
-        self.assertGreater(copied_count, 0, "At least some test codepoints should be copied")
+class FontMergeIntegrationTest(FontMergeTestCase):
+    """Integration tests for copy_font_glyphs.py"""
 
-        # Verify glyphs were actually copied (check glyf table)
-        self.assertIn('glyf', output, "Output font should have glyf table")
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures that are used across all tests."""
+        super().setUpClass()
 
-        # Check metrics were copied
-        self.assertIn('hmtx', output, "Output font should have hmtx table")
+        # The source font is only ever read, so load what the tests need once
+        cls.source_codepoints, cls.source_cmap, cls.source_metrics = \
+            _load_source_meta(str(cls.source_font))
 
-        print(f"\n✓ Successfully verified {copied_count} test codepoints")
-        print(f"✓ Total codepoints in output font: {len(cmap_codepoints)}")
+    def setUp(self):
+        """Set up before each test."""
+        # Each test writes into its own temporary directory, so tests can run
+        # in parallel (pytest-xdist) without touching each other's files
+        tmp_dir = _output_dir(self._testMethodName)
+        self.output_font = Path(tmp_dir.name) / "test_output.ttf"
+        self.output_renamed = Path(tmp_dir.name) / "test_output_renamed.ttf"
+
+        # Registered first so it runs last, after fonts opened with
+        # _open_output() are closed (a mapped file can't be deleted on Windows)
+        self.addCleanup(tmp_dir.cleanup)
+        # Output paths are rewritten by every run, so drop cached codepoints
+        self.addCleanup(_codepoints_for.cache_clear)
+
+    def _open_output(self, path):
+        """Open an output font read-only and close it when the test finishes."""
+        font = _open_readonly(path)
+        self.addCleanup(font.close)
+        return font
 
-        # Clean up
-        source.close()
-        output.close()
+    def test_script_help(self):
+        """Test that the script shows help message."""
+        result = self._run_script("--help")
+        self.assertEqual(result.returncode, 0, "Help command should exit with code 0")
+        self.assertIn("Copy glyphs", result.stdout, "Help should mention 'Copy glyphs'")
+        self.assertIn("--range", result.stdout, "Help should document --range option")
+        self.assertIn("--family-name", result.stdout, "Help should document --family-name option")
 
     def test_copy_small_range(self):
         """Test copying a small specific range to verify precision."""
@@ -161,40 +333,26 @@ class FontMergeIntegrationTest(unittest.TestCase):
             str(self.source_font),
             str(self.dest_font),
             str(self.output_font),
-            "-r", "U+4E00-U+4E10"  # Small range: 17 characters
+            "-r", "U+4E00-U+4E10",  # Small range: 17 characters
+            "-q"
         )
 
         self.assertEqual(result.returncode, 0, "Script should exit successfully")
         self.assertTrue(self.output_font.exists(), "Output font should be created")
 
-        # Load fonts
-        output = TTFont(str(self.output_font))
-        source = TTFont(str(self.source_font))
-
         # Get codepoints
-        output_codepoints = set()
-        for table in output['cmap'].tables:
-            if hasattr(table, 'cmap'):
-                output_codepoints.update(table.cmap.keys())
-
-        source_codepoints = set()
-        for table in source['cmap'].tables:
-            if hasattr(table, 'cmap'):
-                source_codepoints.update(table.cmap.keys())
+        output_codepoints = _codepoints_for(str(self.output_font))
 
         # Check the range
-        expected_range = set(range(0x4E00, 0x4E11))
-        available_in_source = expected_range & source_codepoints
-        copied_codepoints = expected_range & output_codepoints
+        expected_range = range(0x4E00, 0x4E11)
+        available_in_source = self.source_codepoints.intersection(expected_range)
+        copied_codepoints = output_codepoints.intersection(expected_range)
 
         # All available characters in the range should be copied
         self.assertEqual(available_in_source, copied_codepoints,
             "All characters in the specified range that exist in source should be copied")
 
-        print(f"\n✓ Copied {len(copied_codepoints)} characters from small range")
-
-        source.close()
-        output.close()
+        logger.debug("✓ Copied %d characters from small range", len(copied_codepoints))
 
     def test_copy_with_rename(self):
         """Test copying glyphs and renaming the font family."""
@@ -205,46 +363,54 @@ class FontMergeIntegrationTest(unittest.TestCase):
             str(self.dest_font),
             str(self.output_renamed),
             "-r", "U+4E00-U+4E20",  # Small range for faster testing
-            "-f", new_family_name
+            "-f", new_family_name,
+            "-q"
         )
 
         self.assertEqual(result.returncode, 0, "Script should exit successfully")
         self.assertTrue(self.output_renamed.exists(), "Output font should be created")
 
         # Load the output font
-        output = TTFont(str(self.output_renamed))
+        output = self._open_output(self.output_renamed)
 
         # Check that name table exists
         self.assertIn('name', output, "Output font should have name table")
 
         # Check that family name was updated
         name_table = output['name']
-        family_names = []
-        for record in name_table.names:
-            if record.nameID == 1:  # Font Family name
-                family_names.append(record.toUnicode())
-
-        self.assertTrue(any(new_family_name in name for name in family_names),
-            f"Font family should be renamed to '{new_family_name}'")
+        family_renamed = any(new_family_name in record.toUnicode()
+                             for record in name_table.names
+                             if record.nameID == 1)  # Font Family name
+        self.assertTrue(family_renamed, f"Font family should be renamed to '{new_family_name}'")
 
-        print(f"\n✓ Font family successfully renamed to: {new_family_name}")
-        print(f"  Found family names: {family_names}")
-
-        output.close()
+        logger.debug("✓ Font family successfully renamed to: %s", new_family_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Found family names: %s",
+                         [record.toUnicode() for record in name_table.names if record.nameID == 1])
 
     def test_missing_codepoints(self):
         """Test that the script handles missing codepoints gracefully."""
-        # Use a range that likely doesn't exist in source font
+        # U+4E00 is in the source font; U+FFF0-U+FFFF are Specials, mostly
+        # unassigned or noncharacters, so most of them are missing from it
+        requested = frozenset(range(0xFFF0, 0x10000)) | {0x4E00}
         result = self._run_script(
             str(self.source_font),
             str(self.dest_font),
             str(self.output_font),
-            "-r", "U+FFFF"  # Special character unlikely to be in font
+            "-r", "U+4E00",
+            "-r", "U+FFF0-U+FFFF"
         )
 
-        # Script should still exit successfully even if no glyphs copied
+        # Script should still exit successfully even if some glyphs are missing
         self.assertEqual(result.returncode, 0, "Script should handle missing codepoints gracefully")
-        self.assertIn("Skip", result.stdout, "Should report skipped codepoints")
+
+        # Exactly the requested codepoints the source lacks should be reported
+        missing = requested - self.source_codepoints
+        self.assertTrue(missing, "Some requested codepoints should be missing from the source font")
+        reported = [cp for cp in sorted(requested) if f"Skip: U+{cp:04X} " in result.stdout]
+        self.assertEqual(reported, sorted(missing), "Only missing codepoints should be reported as skipped")
+        self.assertIn(f"Skipped: {len(missing)} glyphs", result.stdout,
+            "Skipped count should match the missing codepoints")
 
     def test_multiple_ranges(self):
         """Test copying multiple Unicode ranges in one operation."""
@@ -253,40 +419,25 @@ class FontMergeIntegrationTest(unittest.TestCase):
             str(self.dest_font),
             str(self.output_font),
             "-r", "U+4E00-U+4E10",
-            "-r", "U+4E20-U+4E30"
+            "-r", "U+4E20-U+4E30",
+            "-q"
         )
 
         self.assertEqual(result.returncode, 0, "Script should handle multiple ranges")
         self.assertTrue(self.output_font.exists(), "Output font should be created")
 
         # Verify glyphs from both ranges were copied
-        output = TTFont(str(self.output_font))
-        source = TTFont(str(self.source_font))
-
-        output_codepoints = set()
-        for table in output['cmap'].tables:
-            if hasattr(table, 'cmap'):
-                output_codepoints.update(table.cmap.keys())
-
-        source_codepoints = set()
-        for table in source['cmap'].tables:
-            if hasattr(table, 'cmap'):
-                source_codepoints.update(table.cmap.keys())
+        output_codepoints = _codepoints_for(str(self.output_font))
 
         # Check both ranges
-        range1 = set(range(0x4E00, 0x4E11))
-        range2 = set(range(0x4E20, 0x4E31))
-
-        copied1 = range1 & output_codepoints & source_codepoints
-        copied2 = range2 & output_codepoints & source_codepoints
+        copied_from_source = output_codepoints & self.source_codepoints
+        copied1 = copied_from_source.intersection(range(0x4E00, 0x4E11))
+        copied2 = copied_from_source.intersection(range(0x4E20, 0x4E31))
 
         self.assertGreater(len(copied1), 0, "Should copy glyphs from first range")
         self.assertGreater(len(copied2), 0, "Should copy glyphs from second range")
 
-        print(f"\n✓ Copied {len(copied1)} from range 1 and {len(copied2)} from range 2")
-
-        source.close()
-        output.close()
+        logger.debug("✓ Copied %d from range 1 and %d from range 2", len(copied1), len(copied2))
 
     def test_glyph_metrics_preserved(self):
         """Test that glyph metrics are properly copied."""
@@ -294,35 +445,26 @@ class FontMergeIntegrationTest(unittest.TestCase):
             str(self.source_font),
             str(self.dest_font),
             str(self.output_font),
-            "-r", "U+4E00-U+4E05"
+            "-r", "U+4E00-U+4E05",
+            "-q"
         )
 
         self.assertEqual(result.returncode, 0, "Script should exit successfully")
 
-        # Load fonts
-        source = TTFont(str(self.source_font))
-        output = TTFont(str(self.output_font))
+        # Load output font; the source cmap and metrics are shared across tests
+        output = self._open_output(self.output_font)
 
         # Get a codepoint that should be copied
         test_cp = 0x4E00
 
         # Get glyph names
-        source_glyph_name = None
-        for table in source['cmap'].tables:
-            if test_cp in table.cmap:
-                source_glyph_name = table.cmap[test_cp]
-                break
-
-        output_glyph_name = None
-        for table in output['cmap'].tables:
-            if test_cp in table.cmap:
-                output_glyph_name = table.cmap[test_cp]
-                break
+        source_glyph_name = self.source_cmap.get(test_cp)
+        output_glyph_name = output['cmap'].getBestCmap().get(test_cp)
 
         if source_glyph_name and output_glyph_name:
             # Check metrics
-            if source_glyph_name in source['hmtx'].metrics:
-                source_metrics = source['hmtx'][source_glyph_name]
+            if source_glyph_name in self.source_metrics:
+                source_metrics = self.source_metrics[source_glyph_name]
                 output_metrics = output['hmtx'][output_glyph_name]
 
                 self.assertEqual(source_metrics[0], output_metrics[0],
@@ -330,23 +472,262 @@ class FontMergeIntegrationTest(unittest.TestCase):
                 self.assertEqual(source_metrics[1], output_metrics[1],
                     "Left side bearing should be preserved")
 
-                print(f"\n✓ Metrics preserved: advance={source_metrics[0]}, lsb={source_metrics[1]}")
+                logger.debug("✓ Metrics preserved: advance=%d, lsb=%d", source_metrics[0], source_metrics[1])
+
+    def test_composite_glyphs_preserved(self):
+        """Test that composite glyphs keep their components when copied."""
+        composite_codepoints = _composite_codepoints(str(self.source_font))
+        if not composite_codepoints:
+            self.skipTest("Source font maps no composite glyphs")
+
+        source = _open_readonly(self.source_font)
+        self.addCleanup(source.close)
+        source_glyf = source['glyf']
+
+        # Also copy the mapped glyphs the composites use, so those components
+        # are renamed to uniXXXX in the output
+        codepoints_by_name = {name: cp for cp, name in self.source_cmap.items()}
+        codepoints = set(composite_codepoints)
+        for cp in composite_codepoints:
+            for component in source_glyf[self.source_cmap[cp]].components:
+                if component.glyphName in codepoints_by_name:
+                    codepoints.add(codepoints_by_name[component.glyphName])
+
+        range_args = []
+        for cp in sorted(codepoints):
+            range_args += ["-r", f"U+{cp:04X}"]
+        result = self._run_script(
+            str(self.source_font),
+            str(self.dest_font),
+            str(self.output_font),
+            *range_args,
+            "-q"
+        )
 
-        source.close()
-        output.close()
+        self.assertEqual(result.returncode, 0, f"Script should exit successfully. Error: {result.stderr}")
+
+        output = self._open_output(self.output_font)
+        output_cmap = output['cmap'].getBestCmap()
+        output_glyf = output['glyf']
+        output_names = set(output.getGlyphOrder())
+
+        for cp in composite_codepoints:
+            source_glyph = source_glyf[self.source_cmap[cp]]
+            output_glyph = output_glyf[output_cmap[cp]]
+
+            self.assertTrue(output_glyph.isComposite(), f"U+{cp:04X} should still be a composite glyph")
+            self.assertEqual(len(output_glyph.components), len(source_glyph.components),
+                f"U+{cp:04X} should keep all of its components")
+            for component in output_glyph.components:
+                self.assertIn(component.glyphName, output_names,
+                    f"Component '{component.glyphName}' of U+{cp:04X} should exist in the output font")
+
+        logger.debug("✓ Composite glyphs preserved: %s", ", ".join(f"U+{cp:04X}" for cp in composite_codepoints))
+
+    def test_font_bounds_recalculated(self):
+        """Test that glyph and font-wide bounds match a full fontTools recalculation."""
+        # Copies of new glyphs only widen the stored values; copies whose
+        # components replace destination glyphs make fontTools recalculate
+        replacing = _replacing_codepoints(str(self.source_font), str(self.dest_font))
+        scenarios = {
+            'new glyphs only': sorted(self.source_codepoints.intersection(range(0x4E00, 0x4E31)) - replacing),
+            'replacing destination glyphs': sorted(replacing)[:3],
+        }
+        if not any(scenarios.values()):
+            self.skipTest("No codepoints to copy from the source font")
+
+        for index, (scenario, codepoints) in enumerate(scenarios.items()):
+            if not codepoints:
+                logger.debug("No codepoints for bounds scenario: %s", scenario)
+                continue
+
+            output_font = self.output_font.with_name(f"test_output_{index}.ttf")
+            range_args = []
+            for cp in codepoints:
+                range_args += ["-r", f"U+{cp:04X}"]
+            result = self._run_script(
+                str(self.source_font),
+                str(self.dest_font),
+                str(output_font),
+                *range_args,
+                "-q"
+            )
+
+            self.assertEqual(result.returncode, 0,
+                f"Script should exit successfully ({scenario}). Error: {result.stderr}")
+            self._assert_bounds_recalculated(output_font, scenario)
+
+    def _assert_bounds_recalculated(self, path, scenario):
+        """Assert that the stored bounds of a font equal a full fontTools recalculation."""
+        # Re-saving with recalcBBoxes=True recalculates the bounds of every
+        # glyph and the font-wide values from them
+        stored = self._open_output(path)
+        recalculated_font = TTFont(str(path))
+        # fontTools only recalculates these when the glyf table is loaded
+        recalculated_font['glyf']
+        buffer = io.BytesIO()
+        recalculated_font.save(buffer)
+        recalculated_font.close()
+        buffer.seek(0)
+        recalculated = TTFont(buffer)
+        self.addCleanup(recalculated.close)
+
+        stored_glyf = stored['glyf']
+        recalculated_glyf = recalculated['glyf']
+        for glyph_name in stored.getGlyphOrder():
+            stored_glyph = stored_glyf[glyph_name]
+            recalculated_glyph = recalculated_glyf[glyph_name]
+            self.assertEqual(
+                [getattr(stored_glyph, name, None) for name in ('xMin', 'yMin', 'xMax', 'yMax')],
+                [getattr(recalculated_glyph, name, None) for name in ('xMin', 'yMin', 'xMax', 'yMax')],
+                f"Bounds of '{glyph_name}' should match a full recalculation ({scenario})")
+
+        fields = {
+            'head': ['xMin', 'yMin', 'xMax', 'yMax'],
+            'maxp': ['maxPoints', 'maxContours', 'maxCompositePoints', 'maxCompositeContours',
+                     'maxComponentElements', 'maxComponentDepth'],
+            'hhea': ['advanceWidthMax', 'minLeftSideBearing', 'minRightSideBearing', 'xMaxExtent'],
+            'vhea': ['advanceHeightMax', 'minTopSideBearing', 'minBottomSideBearing', 'yMaxExtent'],
+        }
+        for tag, names in fields.items():
+            if tag not in stored:
+                continue
+            for name in names:
+                self.assertEqual(getattr(stored[tag], name), getattr(recalculated[tag], name),
+                    f"{tag}.{name} should match a full recalculation ({scenario})")
+
+
+class CJKRangeCopyTest(FontMergeTestCase):
+    """
+    Checks on one copy of CJK Unified Ideographs.
+
+    The copy is the most expensive step in the suite, so it runs once in
+    setUpClass and every test inspects the same output font. Only the start
+    of the block and the sampled characters are copied; CJKBlockCopyTest
+    repeats the checks on the full block.
+    """
+
+    # Ranges passed to the script with -r
+    RANGES = ["U+4E00-U+4E10", "U+4E8C", "U+571F", "U+6728", "U+6C34", "U+706B", "U+91D1"]
+
+    @classmethod
+    def setUpClass(cls):
+        """Copy the CJK ranges once and load the output font."""
+        super().setUpClass()
+        cls.tmp_dir = _output_dir(cls.__name__)
+        cls.output_font = Path(cls.tmp_dir.name) / "test_output.ttf"
+
+        range_args = []
+        for unicode_range in cls.RANGES:
+            range_args += ["-r", unicode_range]
+        result = cls._run_script(
+            str(cls.source_font),
+            str(cls.dest_font),
+            str(cls.output_font),
+            *range_args
+        )
+
+        # Log output for debugging
+        logger.debug("Script output:\n%s", result.stdout)
+        if result.stderr:
+            logger.debug("Script errors:\n%s", result.stderr)
+
+        # Check script executed successfully and created the output file
+        if result.returncode != 0:
+            raise RuntimeError(f"Script should exit with code 0. Error: {result.stderr}")
+        if not cls.output_font.exists():
+            raise RuntimeError(f"Output font file should be created: {cls.output_font}")
+
+        cls.source_codepoints = _load_source_meta(str(cls.source_font))[0]
+        cls.output_codepoints = _codepoints_for(str(cls.output_font))
+        cls.output = _open_readonly(cls.output_font)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared output font and remove its directory."""
+        cls.output.close()
+        _codepoints_for.cache_clear()
+        cls.tmp_dir.cleanup()
+
+    def test_cmap_present(self):
+        """Test that the output font has a cmap table."""
+        self.assertIn('cmap', self.output, "Output font should have cmap table")
+
+    def test_glyf_present(self):
+        """Test that glyphs were actually copied into a glyf table."""
+        self.assertIn('glyf', self.output, "Output font should have glyf table")
+
+    def test_hmtx_present(self):
+        """Test that metrics were copied into an hmtx table."""
+        self.assertIn('hmtx', self.output, "Output font should have hmtx table")
+
+    def test_codepoints_sampled(self):
+        """Test that sample CJK characters from the source are in the output."""
+        # Test some specific CJK characters that should be present
+        test_codepoints = [
+            0x4E00,  # 一 (one)
+            0x4E8C,  # 二 (two)
+            0x4E09,  # 三 (three)
+            0x6C34,  # 水 (water)
+            0x706B,  # 火 (fire)
+            0x6728,  # 木 (tree/wood)
+            0x91D1,  # 金 (gold/metal)
+            0x571F,  # 土 (earth)
+        ]
+
+        # Check that test codepoints that exist in source are in output
+        expected = self.source_codepoints.intersection(test_codepoints)
+        missing = expected - self.output_codepoints
+        self.assertFalse(missing, "Codepoints should be in output font: " +
+            ", ".join(f"U+{cp:04X} ({chr(cp)})" for cp in sorted(missing)))
+        copied_count = len(expected)
+
+        self.assertGreater(copied_count, 0, "At least some test codepoints should be copied")
+
+        logger.debug("✓ Successfully verified %d test codepoints", copied_count)
+        logger.debug("✓ Total codepoints in output font: %d", len(self.output_codepoints))
+
+
+@unittest.skipUnless(os.environ.get("FONT_MERGE_SLOW"), "set FONT_MERGE_SLOW=1 to copy the full CJK block")
+class CJKBlockCopyTest(CJKRangeCopyTest):
+    """Checks on one copy of the full CJK Unified Ideographs block (U+4E00-U+9FFF)."""
+
+    RANGES = ["U+4E00-U+9FFF"]
 
 
 def run_tests():
     """Run all integration tests."""
+    global _use_fixture_sig
+    _use_fixture_sig = bool(os.environ.get("FONT_MERGE_CACHE"))
+
+    # Test details are logged at DEBUG level; run with LOGLEVEL=DEBUG to see them
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper(), format="%(message)s")
+
     # Create test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(FontMergeIntegrationTest)
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(FontMergeIntegrationTest),
+        loader.loadTestsFromTestCase(CJKRangeCopyTest),
+        loader.loadTestsFromTestCase(CJKBlockCopyTest),
+    ])
 
     # Run tests with verbose output
     runner = unittest.TextTestRunner(verbosity=2)
+
+    # Run the smoke test first and stop early if the script is broken
+    if not runner.run(loader.loadTestsFromTestCase(SmokeTest)).wasSuccessful():
+        return 1
+
     result = runner.run(suite)
 
-    # Return exit code based on results
-    return 0 if result.wasSuccessful() else 1
+    if not result.wasSuccessful():
+        return 1
+
+    # Remember the fixtures this run passed with, for FONT_MERGE_CACHE=1
+    if _use_fixture_sig:
+        FIXTURE_SIG_PATH.parent.mkdir(exist_ok=True)
+        FIXTURE_SIG_PATH.write_text(_fixture_sig())
+    return 0
 
 
 if __name__ == '__main__':